@@ -2,37 +2,95 @@
 Flask application to provide a web interface to statejobs-helper.
 """
 
+import asyncio
 import os
 
-from flask import Flask, render_template, request, send_file
+from flask import Flask, jsonify, render_template, request, send_file, url_for
 
+from statejobs_helper.assets import StaticAssets
+from statejobs_helper.compression import compress_response
 from statejobs_helper.coverletter import fill_coverletter_template
-from statejobs_helper.parser import get_job_data
+from statejobs_helper.parser import (
+    get_job_data_async,
+    get_jobs_data_async,
+)
+from statejobs_helper.pdf_queue import PdfQueue, QueueFull
+from statejobs_helper.profiling import RequestProfiler
+from statejobs_helper.snapshot import import_snapshot
 from statejobs_helper.utilities import html_to_pdf
 
 app = Flask(__name__)
 
+# Fingerprinted static URLs, precompressed once at startup
+assets = StaticAssets(app)
+
+# ETag / If-None-Match and gzip/brotli for HTML and JSON responses
+app.after_request(compress_response)
+
+# Opt-in per-request profiling (STATEJOBS_PROFILING=1 + STATEJOBS_PROFILING_TOKEN)
+profiler = RequestProfiler(app)
+
+# Come up with a warm vacancy cache (see `cli.py export-cache`)
+CACHE_SNAPSHOT = os.environ.get("STATEJOBS_CACHE_SNAPSHOT")
+if CACHE_SNAPSHOT and os.path.exists(CACHE_SNAPSHOT):
+    try:
+        LOADED, TOTAL = import_snapshot(CACHE_SNAPSHOT)
+        if TOTAL and not LOADED:
+            app.logger.warning(
+                "Cache snapshot %s has %d jobs but all are past the max age",
+                CACHE_SNAPSHOT,
+                TOTAL,
+            )
+        else:
+            app.logger.info("Loaded %d cached jobs from %s", LOADED, CACHE_SNAPSHOT)
+    except (OSError, ValueError) as e:
+        app.logger.warning("Could not load cache snapshot %s: %s", CACHE_SNAPSHOT, e)
+
+
+# Optional queued PDF rendering for /coverletter/download (STATEJOBS_PDF_QUEUE=1)
+app.config.setdefault("PDF_QUEUE_ENABLED", os.environ.get("STATEJOBS_PDF_QUEUE") == "1")
+pdf_queue = PdfQueue(
+    os.environ.get("STATEJOBS_PDF_QUEUE_DIR", os.path.join(app.instance_path, "pdfs")),
+    html_to_pdf,
+    workers=int(os.environ.get("STATEJOBS_PDF_QUEUE_WORKERS", 2)),
+    max_depth=int(os.environ.get("STATEJOBS_PDF_QUEUE_DEPTH", 16)),
+    timeout=float(os.environ.get("STATEJOBS_PDF_QUEUE_TIMEOUT", 60)),
+    ttl=float(os.environ.get("STATEJOBS_PDF_QUEUE_TTL", 15 * 60)),
+)
+
+# Longest a status request may block waiting for a render to finish. Kept
+# short since each waiting request holds one of the worker's few threads;
+# clients poll again instead.
+PDF_WAIT_MAX_SECONDS = 2
+
+
+@app.context_processor
+def inject_pdf_queue_flag():
+    """Let the editor know whether it should use queued PDF downloads."""
+    return {"pdf_queue_enabled": app.config["PDF_QUEUE_ENABLED"]}
+
 
 @app.route("/", methods=["GET", "POST"])
-def index():
+async def index():
     """
     Start page for the application, handle getting the index page.
     """
     if request.method == "POST":
         job_ids = [jid.strip() for jid in request.form.get("job_ids", "").split(",")]
-        results = []
 
-        for job_id in job_ids:
-            job_data = get_job_data(job_id)
-            if job_data and job_data.get("title"):
-                results.append(job_data)
+        # All IDs are fetched concurrently
+        results = [
+            job_data
+            for job_data in await get_jobs_data_async(job_ids)
+            if job_data and job_data.get("title")
+        ]
 
         return render_template("results.html", jobs=results)
     return render_template("index.html")
 
 
 @app.route("/coverletter", methods=["GET", "POST"])
-def coverletter():
+async def coverletter():
     """
     Route to handle bring up the cover letter editor for a specific job id.
     """
@@ -40,7 +98,7 @@ def coverletter():
     if not job_id:
         return "Missing job ID", 400
 
-    job_data = get_job_data(job_id)
+    job_data = await get_job_data_async(job_id)
 
     if not job_data:
         return f"Could not fetch data for job ID: {job_id}", 500
@@ -51,7 +109,9 @@ def coverletter():
     if request.method == "POST":
         file = request.files.get("template")
         if file:
-            filled_text, _, font_size = fill_coverletter_template(job_data, file)
+            filled_text, _, font_size = await asyncio.to_thread(
+                fill_coverletter_template, job_data, file
+            )
 
     return render_template(
         "coverletter.html", job=job_data, letter_text=filled_text, font_size=font_size
@@ -59,7 +119,7 @@ def coverletter():
 
 
 @app.route("/upload_template", methods=["POST"])
-def upload_template():
+async def upload_template():
     """
     Route to handle uploading user template for population with job details.
     """
@@ -75,12 +135,15 @@ def upload_template():
     if not file or file.filename == "":
         return "No selected file", 400
 
-    job_data = get_job_data(job_id)
+    job_data = await get_job_data_async(job_id)
     if not job_data:
         return "Could not fetch job data", 500
 
     try:
-        filled_text, filled_html, font_size = fill_coverletter_template(job_data, file)
+        # Template extraction and SpaCy run in a worker thread
+        filled_text, filled_html, font_size = await asyncio.to_thread(
+            fill_coverletter_template, job_data, file
+        )
     except ValueError as e:
         return f"Failed to process template: {e}", 400
 
@@ -110,20 +173,79 @@ def download_pdf():
     if font_size.endswith(".0pt"):
         font_size = font_size.replace(".0pt", "pt")
 
+    # Queued mode: render in the background and hand back a token to poll
+    if app.config["PDF_QUEUE_ENABLED"] and request.form.get("mode") == "queued":
+        try:
+            token = pdf_queue.submit(html_content, font_size, job_id)
+        except QueueFull as e:
+            return jsonify(error=str(e)), 503
+        return (
+            jsonify(
+                token=token,
+                status_url=url_for("coverletter_download_status", token=token),
+                download_url=url_for("coverletter_download_file", token=token),
+            ),
+            202,
+        )
+
     pdf_buffer = html_to_pdf(html_content, font_size)
 
+    return send_file(
+        pdf_buffer,
+        as_attachment=True,
+        download_name=_pdf_filename(job_id),
+        mimetype="application/pdf",
+    )
+
+
+def _pdf_filename(job_id: str | None) -> str:
+    """Download name for a cover letter PDF."""
     # Dynamically set the filename based on job_id
     if job_id:
         # Construct the file name: Vacancy <#>.pdf
-        pdf_filename = f"Vacancy {job_id}.pdf"
-    else:
-        # Fallback to the default name if job_id is missing
-        pdf_filename = "cover_letter.pdf"
+        return f"Vacancy {job_id}.pdf"
+    # Fallback to the default name if job_id is missing
+    return "cover_letter.pdf"
+
+
+@app.route("/coverletter/download/<token>", endpoint="coverletter_download_status")
+def download_status(token):
+    """
+    Status of a queued PDF render. Pass ?wait=<seconds> to block until it
+    finishes (up to PDF_WAIT_MAX_SECONDS).
+    """
+    try:
+        wait = min(float(request.args.get("wait", 0)), PDF_WAIT_MAX_SECONDS)
+    except ValueError:
+        wait = 0
+
+    state = pdf_queue.wait(token, wait) if wait > 0 else pdf_queue.status(token)
+    if not state:
+        return jsonify(error="Unknown or expired token"), 404
+
+    body = {"token": token, "status": state["status"]}
+    if state["status"] == "done":
+        body["download_url"] = url_for("coverletter_download_file", token=token)
+    elif state["status"] == "failed":
+        body["error"] = state.get("error")
+    return jsonify(body)
+
+
+@app.route("/coverletter/download/<token>/file", endpoint="coverletter_download_file")
+def download_file(token):
+    """Serve the finished PDF of a queued render."""
+    state = pdf_queue.status(token)
+    if not state:
+        return "Unknown or expired token", 404
+
+    path = pdf_queue.result_path(token)
+    if not path:
+        return f"PDF is not ready (status: {state['status']})", 409
 
     return send_file(
-        pdf_buffer,
+        path,
         as_attachment=True,
-        download_name=pdf_filename,
+        download_name=_pdf_filename(state.get("job_id")),
         mimetype="application/pdf",
     )
 
@@ -134,6 +256,69 @@ def history():
     return render_template("history.html")
 
 
+# Upper bound on IDs per /api/jobs call, each may cost an upstream fetch
+API_MAX_IDS = 50
+
+
+def _split_param(value) -> list[str]:
+    """
+    Accept either a comma-separated string or a list of strings.
+
+    Raises ValueError for anything else.
+    """
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise ValueError("must be a string or a list of strings")
+    return [v.strip() for v in value if v.strip()]
+
+
+@app.route("/api/jobs", methods=["GET", "POST"])
+async def api_jobs():
+    """
+    Batch JSON lookup of job IDs for integrations.
+
+    IDs and optional fields come from ?ids=1,2&fields=title,salary or a JSON
+    body {"ids": [...], "fields": [...]}. Each job is reported with a status of
+    "ok", "not_found" (page has no posting) or "error" (fetch failed).
+    """
+    body = request.get_json(silent=True)
+    if body is None:
+        body = {}
+    elif not isinstance(body, dict):
+        return jsonify(error="JSON body must be an object"), 400
+
+    try:
+        job_ids = _split_param(body.get("ids") or request.values.get("ids", ""))
+    except ValueError as e:
+        return jsonify(error=f"ids {e}"), 400
+    try:
+        fields = _split_param(body.get("fields") or request.values.get("fields", ""))
+    except ValueError as e:
+        return jsonify(error=f"fields {e}"), 400
+
+    if not job_ids:
+        return jsonify(error="No job ids provided"), 400
+    if len(job_ids) > API_MAX_IDS:
+        return jsonify(error=f"At most {API_MAX_IDS} job ids per request"), 400
+
+    job_ids = list(dict.fromkeys(job_ids))
+
+    jobs = []
+    for job_id, job_data in zip(job_ids, await get_jobs_data_async(job_ids)):
+        if job_data is None:
+            jobs.append({"job_id": job_id, "status": "error"})
+            continue
+        if not job_data.get("title"):
+            jobs.append({"job_id": job_id, "status": "not_found"})
+            continue
+        if fields:
+            job_data = {k: v for k, v in job_data.items() if k in fields}
+        jobs.append({"job_id": job_id, "status": "ok", "data": job_data})
+
+    return jsonify(jobs=jobs)
+
+
 if __name__ == "__main__":
     # Make it work both locally and on Render
     port = int(os.environ.get("PORT", 5000))
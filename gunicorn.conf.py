@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for statejobs-helper.
+
+The app is loaded once in the master process and heavy dependencies (SpaCy and
+its model, python-docx, PyPDF2, reportlab, pdfkit) are preloaded there, so
+forked workers share that memory copy-on-write instead of each paying the
+import and model-load cost on their first cover letter request.
+"""
+
+import os
+
+from statejobs_helper.startup import preload
+
+# pylint: disable=invalid-name
+preload_app = True
+
+# Threaded workers so a request waiting on upstream fetches doesn't hold the
+# whole worker; within a request, job pages are fetched concurrently on an
+# asyncio event loop (see parser.get_jobs_data_async).
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+
+def on_starting(server):  # pylint: disable=unused-argument
+    """Load heavy dependencies in the master before any worker is forked."""
+    preload()
@@ -0,0 +1,119 @@
+"""
+Content-hash fingerprinted static assets with long-lived caching.
+
+Every file under static/ is read once at startup, hashed, and precompressed so
+requests for it never touch the disk or the compressor.
+"""
+
+import hashlib
+import mimetypes
+import os
+from dataclasses import dataclass, field
+
+from flask import Response, abort, request, url_for
+
+from statejobs_helper.compression import (
+    compress,
+    is_compressible,
+    supported_encodings,
+)
+
+# Fingerprinted URLs change whenever the content does, so they can be cached forever
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass
+class Asset:
+    """A single static file held in memory with its precompressed variants."""
+
+    filename: str
+    digest: str
+    mimetype: str
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+
+def _fingerprint(filename: str, digest: str) -> str:
+    """css/styles.css -> css/styles.<digest>.css"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{digest}{ext}"
+
+
+class StaticAssets:
+    """
+    Serves the app's static folder from /assets/ under fingerprinted names.
+
+    Templates call ``asset_url('css/styles.css')`` instead of
+    ``url_for('static', ...)``; files not known at startup fall back to
+    Flask's regular static route.
+    """
+
+    def __init__(self, app=None):
+        self._by_filename: dict[str, Asset] = {}
+        self._by_fingerprint: dict[str, Asset] = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Load the static folder and register the route and template helper."""
+        if app.static_folder:
+            self.load(app.static_folder)
+        app.add_url_rule("/assets/<path:filename>", "assets", self.serve)
+        app.jinja_env.globals["asset_url"] = self.url_for
+
+    def load(self, static_folder: str):
+        """Read, hash and precompress every file under static_folder."""
+        for dirpath, _, filenames in os.walk(static_folder):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                filename = os.path.relpath(path, static_folder).replace(os.sep, "/")
+
+                with open(path, "rb") as f:
+                    data = f.read()
+
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                mimetype = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                asset = Asset(filename, digest, mimetype, {"identity": data})
+
+                if is_compressible(mimetype):
+                    for encoding in supported_encodings():
+                        compressed = compress(data, encoding, best=True)
+                        if len(compressed) < len(data):
+                            asset.variants[encoding] = compressed
+
+                self._by_filename[filename] = asset
+                self._by_fingerprint[_fingerprint(filename, digest)] = asset
+
+    def url_for(self, filename: str) -> str:
+        """URL for a static file, fingerprinted when the file is known."""
+        asset = self._by_filename.get(filename)
+        if not asset:
+            return url_for("static", filename=filename)
+        return url_for("assets", filename=_fingerprint(filename, asset.digest))
+
+    def serve(self, filename: str):
+        """Serve a fingerprinted asset, honouring If-None-Match and Accept-Encoding."""
+        asset = self._by_fingerprint.get(filename)
+        if not asset:
+            abort(404)
+
+        if request.if_none_match.contains_weak(asset.digest):
+            response = Response(status=304)
+        else:
+            encoding = next(
+                (
+                    enc
+                    for enc in supported_encodings()
+                    if enc in asset.variants and request.accept_encodings.quality(enc)
+                ),
+                "identity",
+            )
+
+            response = Response(asset.variants[encoding], mimetype=asset.mimetype)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+
+        # Weak, since the same ETag covers every encoded variant
+        response.set_etag(asset.digest, weak=True)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response.vary.add("Accept-Encoding")
+        return response
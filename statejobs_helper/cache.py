@@ -0,0 +1,97 @@
+"""
+In-memory cache of fetched vacancy pages and their parsed records.
+
+The cache is bounded (least recently used entries are evicted first) and
+entries go stale after a TTL since postings change upstream. Stale entries
+are not served by get() but stay around, so a caller whose refresh fails can
+still fall back to them with get_stale().
+
+Only the parsed record is kept unless keep_html is set (STATEJOBS_CACHE_KEEP_HTML=1
+or by ``cli.py export-cache``), in which case the raw page is kept as well so
+snapshots can be re-parsed if the parser changes.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("STATEJOBS_CACHE_SIZE", 2048))
+DEFAULT_TTL = int(os.environ.get("STATEJOBS_CACHE_TTL", 24 * 60 * 60))
+DEFAULT_KEEP_HTML = os.environ.get("STATEJOBS_CACHE_KEEP_HTML") == "1"
+
+
+@dataclass
+class CacheEntry:
+    """A cached vacancy: raw page HTML (if kept), its parsed record and fetch time."""
+
+    job_id: str
+    html: str | None
+    record: dict
+    fetched_at: float
+
+
+class VacancyCache:
+    """Thread-safe LRU cache of CacheEntry objects keyed by job ID."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: int = DEFAULT_TTL,
+        keep_html: bool = DEFAULT_KEEP_HTML,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.keep_html = keep_html
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_expired(self, entry: CacheEntry, now: float | None = None) -> bool:
+        """Whether entry is older than the TTL."""
+        return (now or time.time()) - entry.fetched_at > self.ttl
+
+    def get(self, job_id: str) -> CacheEntry | None:
+        """Return the fresh entry for job_id, or None."""
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is None or self.is_expired(entry):
+                return None
+            self._entries.move_to_end(job_id)
+            return entry
+
+    def get_stale(self, job_id: str) -> CacheEntry | None:
+        """Return the entry for job_id even if it is past the TTL, or None."""
+        with self._lock:
+            return self._entries.get(job_id)
+
+    def put(
+        self, job_id: str, html: str, record: dict, fetched_at: float | None = None
+    ) -> CacheEntry:
+        """Store a fetched page and its parsed record, evicting the oldest if full."""
+        entry = CacheEntry(
+            job_id, html if self.keep_html else None, record, fetched_at or time.time()
+        )
+        with self._lock:
+            self._entries[job_id] = entry
+            self._entries.move_to_end(job_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def entries(self) -> list[CacheEntry]:
+        """All entries, fresh or stale, least recently used first."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by get_job_data in both the CLI and the Flask app
+vacancy_cache = VacancyCache()
@@ -4,34 +4,23 @@ CLI interface for statejobs-helper to provide some command line functionality.
 
 import argparse
 import json
+import time
 
+from statejobs_helper.cache import vacancy_cache
 from statejobs_helper.parser import get_job_data
+from statejobs_helper.snapshot import export_snapshot, import_snapshot, open_snapshot
 
 
-def main():
-    """
-    Command line interfact for statejobs-helper used to test fetch and parse of web data.
-    """
-    parser = argparse.ArgumentParser(
-        description="Fetch and display New York State job details by job ID."
-    )
+def split_job_ids(raw: str) -> list[str]:
+    """Split a comma-separated list of job IDs, dropping blanks."""
+    return [jid.strip() for jid in raw.split(",") if jid.strip()]
 
-    # Use flagged arguments instead of positional
-    parser.add_argument(
-        "--job-ids",
-        "-j",
-        required=True,
-        help="Comma-separated list of job IDs to fetch (e.g. 12345,67890)",
-    )
 
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Output results as JSON instead of plain text",
-    )
-
-    args = parser.parse_args()
-    job_ids = [jid.strip() for jid in args.job_ids.split(",")]
+def lookup_jobs(args):
+    """
+    Fetch and print the requested jobs, as text or as a JSON dump.
+    """
+    job_ids = split_job_ids(args.job_ids)
 
     print("Welcome to StateJobs Helper.\n")
 
@@ -64,5 +53,232 @@ def main():
         print(json.dumps(results, indent=2))
 
 
+def export_cache(args):
+    """
+    Warm the vacancy cache and write it out as a snapshot file.
+    """
+    # Snapshots carry the raw pages, which the cache otherwise drops
+    vacancy_cache.keep_html = True
+
+    if args.merge:
+        loaded, _ = import_snapshot(args.merge)
+        print(f"Loaded {loaded} cached jobs from {args.merge}")
+
+    failed = []
+    for job_id in split_job_ids(args.fetch_ids or ""):
+        if not get_job_data(job_id):
+            failed.append(job_id)
+
+    count = export_snapshot(args.output)
+    print(f"Exported {count} jobs to {args.output}")
+    if failed:
+        print(f"Could not fetch: {', '.join(failed)}")
+
+
+def import_cache(args):
+    """
+    Validate a snapshot file and report what it contains.
+    """
+    with open_snapshot(args.snapshot) as (header, _):
+        created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(header["created"]))
+        print(f"Snapshot version {header['version']}, created {created}")
+
+    loaded, total = import_snapshot(args.snapshot)
+    print(f"Loaded {loaded} of {total} jobs ({total - loaded} older than max age)")
+
+
+def _read_records(args):
+    """Yield parsed job records from a snapshot, a --json dump and/or fetched IDs."""
+    if args.snapshot:
+        with open_snapshot(args.snapshot) as (_, entries):
+            for item in entries:
+                yield item["record"]
+    if args.from_json:
+        with open(args.from_json, encoding="utf-8") as f:
+            yield from json.load(f)
+    for job_id in split_job_ids(args.fetch_ids or ""):
+        job_data = get_job_data(job_id)
+        if job_data and job_data.get("title"):
+            yield job_data
+
+
+def export_columns(args):
+    """
+    Write parsed postings to a columnar .npz file for `stats`.
+    """
+    # numpy is only needed here and in `stats`
+    from statejobs_helper import columnar  # pylint: disable=import-outside-toplevel
+
+    count = columnar.export_columns(_read_records(args), args.output)
+    print(f"Exported {count} postings to {args.output}")
+
+
+def _grouping(raw: str) -> tuple[str, ...]:
+    """argparse type for stats --by: comma-separated dictionary columns."""
+    from statejobs_helper import columnar  # pylint: disable=import-outside-toplevel
+
+    by = tuple(name.strip() for name in raw.split(",") if name.strip())
+    if not by:
+        raise argparse.ArgumentTypeError("expected at least one column")
+    unknown = [name for name in by if name not in columnar.DICTIONARY_COLUMNS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown column {', '.join(unknown)} "
+            f"(choose from {', '.join(columnar.DICTIONARY_COLUMNS)})"
+        )
+    return by
+
+
+def _percentiles(raw: str) -> list[int]:
+    """argparse type for stats --percentiles: comma-separated integers 0-100."""
+    try:
+        percentiles = [int(p) for p in raw.split(",") if p.strip()]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("percentiles must be integers") from e
+    if not percentiles or not all(0 <= p <= 100 for p in percentiles):
+        raise argparse.ArgumentTypeError("percentiles must be between 0 and 100")
+    return percentiles
+
+
+def stats(args):
+    """
+    Print salary, posting-week and deadline statistics from a columnar file.
+    """
+    from statejobs_helper import columnar  # pylint: disable=import-outside-toplevel
+
+    columns = columnar.load_columns(args.columns)
+    by, percentiles = args.by, args.percentiles
+
+    report = {
+        "postings": len(columns["job_id"]),
+        "salary": columnar.salary_percentiles(columns, by, percentiles),
+        "per_week": columnar.postings_per_week(columns),
+        "deadlines": columnar.deadline_distribution(columns),
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{report['postings']} postings\n")
+
+    print(f"Salary midpoint percentiles by {', '.join(by)}:")
+    for row in report["salary"]:
+        group = " / ".join(row[name] for name in by)
+        values = "  ".join(f"p{p}={row[f'p{p}']:,.0f}" for p in percentiles)
+        print(f"  {group} ({row['postings']}): {values}")
+
+    print("\nPostings per week:")
+    for row in report["per_week"]:
+        print(f"  {row['week_of']}: {row['postings']}")
+
+    deadlines = report["deadlines"]
+    print(f"\nDays open ({deadlines['postings']} postings with both dates):")
+    for bucket, count in deadlines["buckets"].items():
+        print(f"  {bucket}: {count}")
+    for name, value in deadlines["percentiles"].items():
+        print(f"  {name}: {value:g} days")
+
+
+def main():
+    """
+    Command line interfact for statejobs-helper used to test fetch and parse of web data.
+    """
+    parser = argparse.ArgumentParser(
+        description="Fetch and display New York State job details by job ID."
+    )
+
+    # Use flagged arguments instead of positional
+    parser.add_argument(
+        "--job-ids",
+        "-j",
+        help="Comma-separated list of job IDs to fetch (e.g. 12345,67890)",
+    )
+
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON instead of plain text",
+    )
+
+    commands = parser.add_subparsers(dest="command")
+
+    export_parser = commands.add_parser(
+        "export-cache", help="Fetch jobs and save the vacancy cache to a snapshot"
+    )
+    export_parser.add_argument(
+        "--output", "-o", required=True, help="Snapshot file to write"
+    )
+    export_parser.add_argument(
+        "--job-ids",
+        "-j",
+        dest="fetch_ids",
+        help="Comma-separated list of job IDs to fetch into the snapshot",
+    )
+    export_parser.add_argument(
+        "--merge",
+        "-m",
+        help="Existing snapshot to start from; its jobs are kept in the output",
+    )
+    export_parser.set_defaults(func=export_cache)
+
+    import_parser = commands.add_parser(
+        "import-cache", help="Validate and load a vacancy cache snapshot"
+    )
+    import_parser.add_argument("snapshot", help="Snapshot file to read")
+    import_parser.set_defaults(func=import_cache)
+
+    columns_parser = commands.add_parser(
+        "export-columns", help="Export parsed postings to a columnar file for stats"
+    )
+    columns_parser.add_argument(
+        "--output", "-o", required=True, help="Column file to write (.npz)"
+    )
+    columns_parser.add_argument("--snapshot", "-s", help="Cache snapshot to read")
+    columns_parser.add_argument(
+        "--from-json", help="File holding the output of --json to read"
+    )
+    columns_parser.add_argument(
+        "--job-ids",
+        "-j",
+        dest="fetch_ids",
+        help="Comma-separated list of job IDs to fetch",
+    )
+    columns_parser.set_defaults(func=export_columns)
+
+    stats_parser = commands.add_parser(
+        "stats", help="Salary, posting and deadline statistics from a column file"
+    )
+    stats_parser.add_argument("columns", help="Column file from export-columns")
+    stats_parser.add_argument(
+        "--by",
+        type=_grouping,
+        default="agency,grade",
+        help="Comma-separated grouping for salary percentiles (agency, grade, title)",
+    )
+    stats_parser.add_argument(
+        "--percentiles",
+        type=_percentiles,
+        default="25,50,75,90",
+        help="Comma-separated percentiles (0-100)",
+    )
+    stats_parser.add_argument(
+        "--json", action="store_true", help="Output the report as JSON"
+    )
+    stats_parser.set_defaults(func=stats)
+
+    args = parser.parse_args()
+
+    if args.command and args.job_ids:
+        # Subcommands take their own --job-ids, given after the command name
+        parser.error(f"pass --job-ids after '{args.command}', not before it")
+    elif args.command:
+        args.func(args)
+    elif args.job_ids:
+        lookup_jobs(args)
+    else:
+        parser.error("--job-ids is required")
+
+
 if __name__ == "__main__":
     main()
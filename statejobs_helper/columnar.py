@@ -0,0 +1,211 @@
+"""
+Columnar export of parsed postings and vectorized statistics over it.
+
+Postings are stored as NumPy arrays in a compressed ``.npz`` file: repeated
+strings (agency, grade, title) are dictionary-encoded as integer codes plus a
+table of distinct values, salaries are float columns and dates are
+``datetime64[D]``. Statistics are computed with array operations on those
+columns, without building a Python object per posting.
+"""
+
+import re
+from datetime import datetime
+
+import numpy as np
+
+COLUMNS_VERSION = 1
+
+# Columns stored as <name>_codes + <name>_values
+DICTIONARY_COLUMNS = ("agency", "grade", "title")
+
+DATE_FORMATS = ("%m/%d/%y", "%m/%d/%Y")
+
+_DOLLARS_RE = re.compile(r"\$\s*([\d,]+(?:\.\d+)?)")
+
+# Upper bounds (inclusive, in days) of the deadline distribution buckets
+DEADLINE_BUCKETS = (7, 14, 30, 60)
+
+
+def parse_salary(text: str | None) -> tuple[float, float]:
+    """
+    (min, max) of an annual salary range like 'From $64,353 to $83,818 Annually'.
+
+    Salaries not stated as annual (hourly, biweekly, ...) or unparseable give
+    (nan, nan).
+    """
+    if not text or "annual" not in text.lower():
+        return np.nan, np.nan
+    amounts = [float(a.replace(",", "")) for a in _DOLLARS_RE.findall(text)]
+    if not amounts:
+        return np.nan, np.nan
+    return amounts[0], amounts[-1]
+
+
+def parse_date(text: str | None) -> str:
+    """ISO date for a posting date like '10/15/25', or 'NaT'."""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime((text or "").strip(), fmt).date().isoformat()
+        except ValueError:
+            continue
+    return "NaT"
+
+
+def records_to_columns(records) -> dict:
+    """Convert parsed job dicts (as from get_job_data) into column arrays."""
+    raw = {name: [] for name in ("job_id", *DICTIONARY_COLUMNS)}
+    salary_min, salary_max, posted, due = [], [], [], []
+
+    for record in records:
+        raw["job_id"].append(str(record.get("job_id", "")))
+        for name in DICTIONARY_COLUMNS:
+            raw[name].append(record.get(name) or "N/A")
+        low, high = parse_salary(record.get("salary"))
+        salary_min.append(low)
+        salary_max.append(high)
+        posted.append(parse_date(record.get("date_posted")))
+        due.append(parse_date(record.get("applications_due")))
+
+    columns = {
+        "version": np.array(COLUMNS_VERSION),
+        "job_id": np.array(raw["job_id"], dtype=str),
+        "salary_min": np.array(salary_min, dtype=np.float64),
+        "salary_max": np.array(salary_max, dtype=np.float64),
+        "date_posted": np.array(posted, dtype="datetime64[D]"),
+        "applications_due": np.array(due, dtype="datetime64[D]"),
+    }
+    for name in DICTIONARY_COLUMNS:
+        values, codes = np.unique(np.array(raw[name], dtype=str), return_inverse=True)
+        columns[f"{name}_values"] = values
+        columns[f"{name}_codes"] = codes.astype(np.int32)
+
+    return columns
+
+
+def export_columns(records, path: str) -> int:
+    """Write records to a compressed .npz file. Returns the number of postings."""
+    columns = records_to_columns(records)
+    np.savez_compressed(path, **columns)
+    return len(columns["job_id"])
+
+
+def load_columns(path: str) -> dict:
+    """Load a column file written by export_columns."""
+    with np.load(path, allow_pickle=False) as data:
+        columns = {name: data[name] for name in data.files}
+    if int(columns["version"]) != COLUMNS_VERSION:
+        raise ValueError(
+            f"Unsupported column file version {int(columns['version'])} "
+            f"(expected {COLUMNS_VERSION})"
+        )
+    return columns
+
+
+def _group_codes(columns: dict, by: tuple[str, ...]) -> np.ndarray:
+    """Combine the dictionary codes of the `by` columns into one group code each."""
+    group = np.zeros(len(columns["job_id"]), dtype=np.int64)
+    for name in by:
+        group = group * len(columns[f"{name}_values"]) + columns[f"{name}_codes"]
+    return group
+
+
+def _group_labels(columns: dict, by: tuple[str, ...], groups: np.ndarray) -> list:
+    """Decode combined group codes back into tuples of strings."""
+    labels = []
+    remaining = groups.copy()
+    for name in reversed(by):
+        size = len(columns[f"{name}_values"])
+        labels.append(columns[f"{name}_values"][remaining % size])
+        remaining //= size
+    return list(zip(*reversed(labels)))
+
+
+def _grouped_percentile(values, starts, counts, pct: float) -> np.ndarray:
+    """
+    pct-th percentile of every group in values, which is sorted by group and
+    then by value, with each group spanning starts[i]:starts[i] + counts[i].
+    """
+    # Linear interpolation between the closest ranks, as np.percentile does
+    position = pct / 100 * (counts - 1)
+    low = np.floor(position).astype(np.int64)
+    high = np.ceil(position).astype(np.int64)
+    lower, upper = values[starts + low], values[starts + high]
+    return lower + (upper - lower) * (position - low)
+
+
+def salary_percentiles(
+    columns: dict, by: tuple[str, ...] = ("agency",), percentiles=(25, 50, 75)
+) -> list[dict]:
+    """
+    Salary percentiles (of each range's midpoint) per group, largest groups first.
+
+    Groups are sorted once with lexsort and every percentile is read off the
+    sorted array by offset, so the work is vectorized across all groups.
+    """
+    salary = (columns["salary_min"] + columns["salary_max"]) / 2
+    valid = ~np.isnan(salary)
+    group = _group_codes(columns, by)[valid]
+    salary = salary[valid]
+    if not salary.size:
+        return []
+
+    order = np.lexsort((salary, group))
+    group, salary = group[order], salary[order]
+    groups, starts, counts = np.unique(group, return_index=True, return_counts=True)
+
+    results = {
+        pct: _grouped_percentile(salary, starts, counts, pct) for pct in percentiles
+    }
+
+    labels = _group_labels(columns, by, groups)
+    return [
+        {
+            **dict(zip(by, (str(v) for v in labels[i]))),
+            "postings": int(counts[i]),
+            **{f"p{pct}": round(float(results[pct][i]), 2) for pct in percentiles},
+        }
+        for i in np.argsort(-counts, kind="stable")
+    ]
+
+
+def postings_per_week(columns: dict) -> list[dict]:
+    """Number of postings per week (weeks start on Monday) by posting date."""
+    posted = columns["date_posted"]
+    posted = posted[~np.isnat(posted)]
+    # datetime64 weeks start on Thursday (the epoch), shift to Monday
+    shift = np.timedelta64(4, "D")
+    monday = (posted - shift).astype("datetime64[W]").astype("datetime64[D]") + shift
+    weeks, counts = np.unique(monday, return_counts=True)
+    return [
+        {"week_of": str(week), "postings": int(count)}
+        for week, count in zip(weeks, counts)
+    ]
+
+
+def deadline_distribution(columns: dict) -> dict:
+    """How long postings stay open: days from posting to applications due."""
+    days = (columns["applications_due"] - columns["date_posted"]).astype(
+        "timedelta64[D]"
+    )
+    days = days[~np.isnat(days)].astype(np.int64)
+    if not days.size:
+        return {"postings": 0, "buckets": {}, "percentiles": {}}
+
+    edges = np.array([-np.inf, *DEADLINE_BUCKETS, np.inf])
+    counts, _ = np.histogram(days, bins=edges + 0.5)
+    names = []
+    lower = 0
+    for upper in DEADLINE_BUCKETS:
+        names.append(f"{lower}-{upper} days")
+        lower = upper + 1
+    names.append(f"{lower}+ days")
+    names[0] = f"<={DEADLINE_BUCKETS[0]} days"
+
+    return {
+        "postings": int(len(days)),
+        "buckets": {name: int(count) for name, count in zip(names, counts)},
+        "percentiles": {
+            f"p{pct}": float(value)
+            for pct, value in zip((10, 50, 90), np.percentile(days, (10, 50, 90)))
+        },
+    }
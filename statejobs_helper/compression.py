@@ -0,0 +1,98 @@
+"""
+Response compression and conditional-request helpers for the Flask app.
+"""
+
+import gzip
+import hashlib
+
+from flask import request
+
+# brotli optional, gzip is always available
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Responses smaller than this are sent as-is; compressing them costs more than it saves
+COMPRESS_MIN_SIZE = 500
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+}
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Content encodings we can produce, in order of preference."""
+    return ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+
+def compress(data: bytes, encoding: str, best: bool = False) -> bytes:
+    """
+    Compress data with the given content encoding.
+
+    ``best`` trades CPU for ratio and is meant for work done once at startup
+    (static assets), not for per-request compression.
+    """
+    if encoding == "br":
+        return brotli.compress(data, quality=11 if best else 5)
+    if encoding == "gzip":
+        # mtime=0 keeps the output stable so identical bodies compress identically
+        return gzip.compress(data, compresslevel=9 if best else 6, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def choose_encoding(accept_encodings) -> str | None:
+    """Pick the preferred encoding the client accepts, or None for identity."""
+    for encoding in supported_encodings():
+        if accept_encodings.quality(encoding) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(mimetype: str | None) -> bool:
+    """Whether a response of this mimetype is worth compressing."""
+    return mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def compress_response(response):
+    """
+    after_request hook: add a weak ETag, answer If-None-Match with 304,
+    and gzip/brotli compress large text responses.
+    """
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or not is_compressible(response.mimetype)
+    ):
+        return response
+
+    body = response.get_data()
+
+    # Weak, since the compressed representations differ byte-for-byte
+    if "ETag" not in response.headers:
+        response.set_etag(hashlib.sha1(body).hexdigest(), weak=True)
+    response.make_conditional(request)
+    if response.status_code == 304:
+        return response
+
+    response.vary.add("Accept-Encoding")
+
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding:
+        response.set_data(compress(body, encoding))
+        response.headers["Content-Encoding"] = encoding
+
+    return response
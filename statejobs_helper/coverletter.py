@@ -2,24 +2,34 @@
 Module for dealing with functionality necessary to support the coverletter routes in app.py.
 """
 
+import functools
 import logging
 from datetime import datetime
 
-import spacy
-
 from statejobs_helper.utilities import extract_text_and_html, fill_template
 
-# Load SpaCy model once at import
 logger = logging.getLogger(__name__)
 
-try:
-    # IMPORTANT: Ensure 'en_core_web_sm' is installed in your environment
-    nlp = spacy.load("en_core_web_sm")
-except (ImportError, OSError):
-    nlp = None
-    logger.warning(
-        "SpaCy model 'en_core_web_sm' not found — using fallback greeting logic."
-    )
+
+@functools.cache
+def get_nlp():
+    """
+    Load the SpaCy model on first use rather than at import.
+
+    Importing spacy and loading the model takes seconds, which every app
+    and CLI start would otherwise pay even if no cover letter is built.
+    Returns None when spacy or the model isn't installed.
+    """
+    try:
+        # IMPORTANT: Ensure 'en_core_web_sm' is installed in your environment
+        import spacy  # pylint: disable=import-outside-toplevel
+
+        return spacy.load("en_core_web_sm")
+    except (ImportError, OSError):
+        logger.warning(
+            "SpaCy model 'en_core_web_sm' not found — using fallback greeting logic."
+        )
+        return None
 
 
 def is_probably_person(name: str) -> bool:
@@ -29,6 +39,7 @@ def is_probably_person(name: str) -> bool:
     if not name or not name.strip():
         return False
 
+    nlp = get_nlp()
     if not nlp:
         # Fallback heuristic: assumes a name if it has a space and isn't too long
         return " " in name.strip() and 1 <= len(name.split()) <= 4
@@ -0,0 +1,222 @@
+"""
+Load-test driver that replays realistic user flows against a running app.
+
+Run the app against the stub upstream (see stub_server.py), e.g.::
+
+    python -m statejobs_helper.stub_server --latency-ms 300 --error-rate 0.02
+    STATEJOBS_BASE_URL=http://127.0.0.1:8001 gunicorn app:app --bind :10000
+    python -m statejobs_helper.loadtest --target http://127.0.0.1:10000 \\
+        --concurrency 20 --duration 60
+
+Set STATEJOBS_CACHE_SIZE=0 on the app to measure uncached upstream fetches.
+Reports throughput, p50/p95/p99 latency and error rate per route.
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+SAMPLE_TEMPLATE = b"""{{ date }}
+
+{{ full_address }}
+
+{{ subject }}
+
+{{ greeting }}
+
+I am writing to apply for the {{ title }} position with {{ agency }}.
+
+Sincerely,
+A. Applicant
+"""
+
+SAMPLE_LETTER_HTML = "<p>Dear Sir or Madam,</p><p><br></p>" + (
+    "<p>I am writing to apply for this position. " * 20 + "</p>"
+)
+
+
+def _search(session, target, job_ids):
+    ids = ", ".join(random.sample(job_ids, min(3, len(job_ids))))
+    return session.post(f"{target}/", data={"job_ids": ids})
+
+
+def _upload(session, target, job_ids):
+    return session.post(
+        f"{target}/upload_template",
+        data={"job_id": random.choice(job_ids)},
+        files={"template": ("template.txt", SAMPLE_TEMPLATE, "text/plain")},
+    )
+
+
+def _download(session, target, job_ids):
+    return session.post(
+        f"{target}/coverletter/download",
+        data={
+            "letter_html": SAMPLE_LETTER_HTML,
+            "font_size": "12pt",
+            "job_id": random.choice(job_ids),
+        },
+    )
+
+
+# Route label -> request function
+FLOWS = {
+    "/": _search,
+    "/upload_template": _upload,
+    "/coverletter/download": _download,
+}
+
+DEFAULT_MIX = "/=6,/upload_template=2,/coverletter/download=2"
+
+
+def parse_mix(raw: str) -> dict[str, float]:
+    """Parse 'route=weight,...' into a weight per route."""
+    mix = {}
+    for part in raw.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip()
+        if route not in FLOWS:
+            raise ValueError(f"Unknown route in mix: {route}")
+        mix[route] = float(weight or 1)
+    return mix
+
+
+def parse_job_ids(raw: str) -> list[str]:
+    """Parse '100000-100199' or '201258,202101' into a list of job IDs."""
+    if "-" in raw and "," not in raw:
+        start, end = (int(x) for x in raw.split("-", 1))
+        return [str(i) for i in range(start, end + 1)]
+    return [jid.strip() for jid in raw.split(",") if jid.strip()]
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    index = max(0, min(len(sorted_values) - 1, rank - 1))
+    return sorted_values[index]
+
+
+# pylint: disable-next=too-many-arguments
+def run(target, job_ids, mix, concurrency, *, duration=None, total=None):
+    """
+    Drive the app with `concurrency` workers until duration seconds have
+    passed or total requests have been sent.
+
+    Returns ({route: [(latency_seconds, ok), ...]}, elapsed_seconds).
+    """
+    results = defaultdict(list)
+    lock = threading.Lock()
+    sent = 0
+    deadline = time.monotonic() + duration if duration else None
+
+    def claim() -> bool:
+        nonlocal sent
+        with lock:
+            if total is not None and sent >= total:
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            sent += 1
+            return True
+
+    def worker():
+        with requests.Session() as session:
+            while claim():
+                route = random.choices(list(mix), list(mix.values()))[0]
+                started = time.perf_counter()
+                try:
+                    response = FLOWS[route](session, target, job_ids)
+                    ok = response.status_code < 400
+                except requests.RequestException:
+                    ok = False
+                latency = time.perf_counter() - started
+                with lock:
+                    results[route].append((latency, ok))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return results, time.perf_counter() - started
+
+
+def summarize(results, elapsed) -> dict:
+    """Throughput, latency percentiles (ms) and error rate per route."""
+    summary = {}
+    for route, samples in sorted(results.items()):
+        latencies = sorted(latency for latency, _ in samples)
+        errors = sum(1 for _, ok in samples if not ok)
+        summary[route] = {
+            "requests": len(samples),
+            "throughput_rps": round(len(samples) / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+            "error_rate": round(errors / len(samples), 4),
+        }
+    return summary
+
+
+def main():
+    """
+    Run a load test and print a per-route report.
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay realistic flows against statejobs-helper under load."
+    )
+    parser.add_argument("--target", default="http://127.0.0.1:10000")
+    parser.add_argument(
+        "--job-ids",
+        default="100000-100199",
+        help="Job IDs to use, as a range (100000-100199) or comma-separated list",
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="route=weight,...")
+    parser.add_argument("--concurrency", "-c", type=int, default=10)
+    parser.add_argument("--duration", "-d", type=float, default=30, help="Seconds")
+    parser.add_argument(
+        "--requests", "-n", type=int, help="Stop after this many requests instead"
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON report")
+    args = parser.parse_args()
+
+    results, elapsed = run(
+        args.target.rstrip("/"),
+        parse_job_ids(args.job_ids),
+        parse_mix(args.mix),
+        args.concurrency,
+        duration=None if args.requests else args.duration,
+        total=args.requests,
+    )
+    summary = summarize(results, elapsed)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    print(
+        f"{sum(len(s) for s in results.values())} requests in {elapsed:.1f}s "
+        f"at concurrency {args.concurrency}\n"
+    )
+    print(
+        f"{'route':<24}{'reqs':>7}{'req/s':>9}{'p50 ms':>9}"
+        f"{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}"
+    )
+    for route, stats in summary.items():
+        print(
+            f"{route:<24}{stats['requests']:>7}{stats['throughput_rps']:>9}"
+            f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+            f"{stats['error_rate']:>9.2%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,42 @@
 Parser module for fetching and pulling data from the statejobs.ny website.
 """
 
+import asyncio
+import contextlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 import requests
 from bs4 import BeautifulSoup
 
+from statejobs_helper.cache import vacancy_cache
+
+# httpx is only needed by the async backend; importing it lazily keeps the CLI fast
+if TYPE_CHECKING:
+    import httpx
+
+# Overridable so load tests can point at a local stub (see stub_server.py)
+BASE_URL = os.environ.get("STATEJOBS_BASE_URL", "https://statejobs.ny.gov")
+VACANCY_PATH = "/public/vacancyDetailsView.cfm"
+
+# Cap on concurrent upstream fetches by the async backend, per process
+ASYNC_MAX_CONNECTIONS = int(os.environ.get("STATEJOBS_MAX_CONNECTIONS", 20))
+
+# Every async view runs on its own event loop (and so its own httpx client),
+# so the cap is a thread-safe semaphore shared by all of them
+_upstream_slots = threading.BoundedSemaphore(ASYNC_MAX_CONNECTIONS)
+
+# Threads that block on _upstream_slots for fetches waiting their turn. Waiters
+# queue here in arrival order; threads start on first use, so this is safe to
+# create before gunicorn forks.
+_slot_waiters = ThreadPoolExecutor(max_workers=4, thread_name_prefix="upstream-slot")
+
 
 def fetch_job_page(job_id: str) -> str | None:
     """Fetch the job page HTML."""
-    url = f"https://statejobs.ny.gov/public/vacancyDetailsView.cfm?id={job_id}"
+    url = f"{BASE_URL}{VACANCY_PATH}?id={job_id}"
     try:
         response = requests.get(url, timeout=10)
         response.raise_for_status()
@@ -18,6 +47,42 @@ def fetch_job_page(job_id: str) -> str | None:
         return None
 
 
+@contextlib.asynccontextmanager
+async def _upstream_slot():
+    """Hold one of the process-wide ASYNC_MAX_CONNECTIONS fetch slots."""
+    # pylint: disable-next=consider-using-with
+    if not _upstream_slots.acquire(blocking=False):
+        # Block on a waiter thread rather than the event loop
+        waiter = _slot_waiters.submit(_upstream_slots.acquire)
+        try:
+            await asyncio.wrap_future(waiter)
+        except asyncio.CancelledError:
+            if not waiter.cancel():
+                # Already waiting on the semaphore: hand the slot back once it
+                # is granted
+                waiter.add_done_callback(lambda _: _upstream_slots.release())
+            raise
+    try:
+        yield
+    finally:
+        _upstream_slots.release()
+
+
+async def fetch_job_page_async(client: "httpx.AsyncClient", job_id: str) -> str | None:
+    """Fetch the job page HTML without blocking the event loop."""
+    import httpx  # pylint: disable=import-outside-toplevel
+
+    url = f"{BASE_URL}{VACANCY_PATH}?id={job_id}"
+    try:
+        async with _upstream_slot():
+            response = await client.get(url, timeout=10)
+        response.raise_for_status()
+        return response.text
+    except httpx.HTTPError as e:
+        print(f"Error fetching job {job_id}: {e}")
+        return None
+
+
 def parse_job_page(html: str) -> dict:
     """Extract job details: title, agency, dates, grade, salary."""
     soup = BeautifulSoup(html, "lxml")
@@ -190,24 +255,85 @@ def parse_contact_info(html: str) -> dict:
     return info
 
 
+def parse_job_data(html: str, job_id: str) -> dict:
+    """Parse every relevant field out of a fetched job page."""
+    job_data = parse_job_page(html)
+    contact_data = parse_contact_info(html)
+    dates = parse_dates(html)
+
+    # Combine all data
+    job_data.update(contact_data)
+    job_data.update(dates)
+    job_data["job_id"] = job_id
+
+    return job_data
+
+
+def _stale_record(job_id: str) -> dict | None:
+    """The cached record for job_id past its TTL, for when a refresh fails."""
+    stale = vacancy_cache.get_stale(job_id)
+    return dict(stale.record) if stale else None
+
+
 def get_job_data(job_id: str) -> dict | None:
     """
     Fetches the HTML for a single job ID and parses all relevant data.
 
     This function abstracts the common web-scraping logic used in both
-    the CLI and the Flask app.
+    the CLI and the Flask app. Results are served from the vacancy cache
+    when a fresh copy is available, and from a stale one if the fetch fails.
     """
+    cached = vacancy_cache.get(job_id)
+    if cached:
+        return dict(cached.record)
+
     html = fetch_job_page(job_id)
     if not html:
-        return None
+        return _stale_record(job_id)
 
-    job_data = parse_job_page(html)
-    contact_data = parse_contact_info(html)
-    dates = parse_dates(html)
+    job_data = parse_job_data(html, job_id)
+    vacancy_cache.put(job_id, html, job_data)
 
-    # Combine all data
-    job_data.update(contact_data)
-    job_data.update(dates)
-    job_data["job_id"] = job_id
+    return dict(job_data)
 
-    return job_data
+
+async def _get_job_data_async(client: "httpx.AsyncClient", job_id: str) -> dict | None:
+    cached = vacancy_cache.get(job_id)
+    if cached:
+        return dict(cached.record)
+
+    html = await fetch_job_page_async(client, job_id)
+    if not html:
+        return _stale_record(job_id)
+
+    # BeautifulSoup parsing is CPU-bound, keep it off the event loop
+    job_data = await asyncio.to_thread(parse_job_data, html, job_id)
+    vacancy_cache.put(job_id, html, job_data)
+
+    return dict(job_data)
+
+
+async def get_jobs_data_async(job_ids: list[str]) -> list[dict | None]:
+    """
+    Async counterpart of get_job_data for several IDs at once.
+
+    Pages are fetched concurrently and parsed in worker threads. Each call
+    has its own client, but at most ASYNC_MAX_CONNECTIONS fetches are in
+    flight across the whole process. Results are in the same order as
+    job_ids, with None where the fetch failed.
+    """
+    import httpx  # pylint: disable=import-outside-toplevel
+
+    limits = httpx.Limits(
+        max_connections=ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections=ASYNC_MAX_CONNECTIONS // 2,
+    )
+    async with httpx.AsyncClient(limits=limits) as client:
+        return await asyncio.gather(
+            *(_get_job_data_async(client, job_id) for job_id in job_ids)
+        )
+
+
+async def get_job_data_async(job_id: str) -> dict | None:
+    """Async counterpart of get_job_data for a single ID."""
+    return (await get_jobs_data_async([job_id]))[0]
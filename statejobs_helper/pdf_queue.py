@@ -0,0 +1,212 @@
+"""
+Background queue for cover letter PDF renders.
+
+Renders run on a small local thread pool instead of inside the download
+request. Job state and finished PDFs live on disk under the queue directory,
+so a client can poll any gunicorn worker for its token, not just the one that
+accepted the job.
+
+Each token has a ``<token>.json`` status file (queued, running, done or
+failed) and, once done, a ``<token>.pdf``. The timeout counts from submission,
+so it covers time spent waiting in the queue as well as rendering. A job past
+it is reported as failed straight away, but a render that is still going is
+left to finish on its own thread (its output is discarded) and keeps its
+render slot and its place in max_depth until it does, so abandoned renders
+never push the load past the configured limits. Finished jobs expire after
+the TTL.
+"""
+
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+TOKEN_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
+class QueueFull(Exception):
+    """Raised when the queue already holds its maximum number of pending jobs."""
+
+
+class PdfQueue:  # pylint: disable=too-many-instance-attributes
+    """Disk-backed PDF render queue with bounded depth, timeouts and expiry."""
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(
+        self,
+        directory: str,
+        render,
+        *,
+        workers: int = 2,
+        max_depth: int = 16,
+        timeout: float = 60,
+        ttl: float = 15 * 60,
+    ):
+        self.directory = directory
+        self.render = render
+        self.max_depth = max_depth
+        self.timeout = timeout
+        self.ttl = ttl
+        # Worker threads are only started on first submit, so this is safe to
+        # create before gunicorn forks.
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="pdf-queue"
+        )
+        # Jobs submitted whose render hasn't finished, and renders in flight
+        # (including abandoned ones, which no longer hold a pool thread)
+        self._pending = 0
+        self._render_slots = threading.BoundedSemaphore(workers)
+        self._lock = threading.Lock()
+
+    def _path(self, token: str, ext: str) -> str:
+        return os.path.join(self.directory, token + ext)
+
+    def _write_status(self, token: str, **state):
+        tmp = self._path(token, ".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self._path(token, ".json"))
+
+    def submit(self, html_content: str, font_size: str, job_id: str | None) -> str:
+        """Queue a render and return its token. Raises QueueFull when at capacity."""
+        with self._lock:
+            if self._pending >= self.max_depth:
+                raise QueueFull(f"PDF queue is full ({self.max_depth} pending)")
+            self._pending += 1
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.prune()
+
+        token = secrets.token_urlsafe(18)
+        created = time.time()
+        self._write_status(token, status="queued", job_id=job_id, created=created)
+        self._executor.submit(
+            self._run, token, html_content, font_size, job_id, created
+        )
+        return token
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+
+    def _render(self, html_content: str, font_size: str) -> Future:
+        """
+        Start a render on its own daemon thread, so it can be abandoned.
+
+        The caller must hold a render slot; the thread releases it, and the
+        job's pending count, when the render actually ends.
+        """
+        future = Future()
+
+        def target():
+            try:
+                future.set_result(self.render(html_content, font_size))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+            finally:
+                self._render_slots.release()
+                self._release()
+
+        threading.Thread(target=target, daemon=True, name="pdf-render").start()
+        return future
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _run(self, token, html_content, font_size, job_id, created: float):
+        base = {"job_id": job_id, "created": created}
+        deadline = created + self.timeout
+        rendering = False
+        try:
+            # Wait for an abandoned render to finish before starting another;
+            # the render thread releases the slot
+            # pylint: disable-next=consider-using-with
+            if not self._render_slots.acquire(timeout=max(0, deadline - time.time())):
+                self._write_status(
+                    token,
+                    status="failed",
+                    error="Timed out waiting in the queue",
+                    finished=time.time(),
+                    **base,
+                )
+                return
+
+            future = self._render(html_content, font_size)
+            rendering = True
+            self._write_status(token, status="running", started=time.time(), **base)
+            try:
+                pdf_buffer = future.result(timeout=deadline - time.time())
+            except TimeoutError:
+                self._write_status(
+                    token,
+                    status="failed",
+                    error="Render timed out",
+                    finished=time.time(),
+                    **base,
+                )
+                return
+
+            tmp = self._path(token, ".pdf.tmp")
+            with open(tmp, "wb") as f:
+                f.write(pdf_buffer.getvalue())
+            os.replace(tmp, self._path(token, ".pdf"))
+            self._write_status(token, status="done", finished=time.time(), **base)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Any render failure is reported to the polling client
+            self._write_status(
+                token, status="failed", error=str(e), finished=time.time(), **base
+            )
+        finally:
+            if not rendering:
+                self._release()
+
+    def status(self, token: str) -> dict | None:
+        """Current state of token, or None if it is unknown or expired."""
+        if not TOKEN_RE.match(token):
+            return None
+        try:
+            with open(self._path(token, ".json"), encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # Covers a worker that died before it could record the timeout
+        if (
+            state["status"] in ("queued", "running")
+            and time.time() - state["created"] > self.timeout
+        ):
+            state = {**state, "status": "failed", "error": "Render timed out"}
+        return state
+
+    def wait(self, token: str, seconds: float, interval: float = 0.2) -> dict | None:
+        """Poll until token is done or failed, or seconds have passed."""
+        deadline = time.time() + seconds
+        state = self.status(token)
+        while state and state["status"] in ("queued", "running"):
+            if time.time() >= deadline:
+                break
+            time.sleep(interval)
+            state = self.status(token)
+        return state
+
+    def result_path(self, token: str) -> str | None:
+        """Path of the finished PDF for token, or None if it isn't ready."""
+        state = self.status(token)
+        if not state or state["status"] != "done":
+            return None
+        return self._path(token, ".pdf")
+
+    def prune(self):
+        """Delete status files and PDFs older than the TTL."""
+        cutoff = time.time() - self.ttl
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,261 @@
+"""
+Opt-in per-request profiling for the Flask app.
+
+Profiling is switched on with STATEJOBS_PROFILING=1 plus a secret in
+STATEJOBS_PROFILING_TOKEN, and then only applies to requests that send that
+token in an ``X-Profile`` header or ``?profile=`` query flag. Without a token
+profiling stays off, since both profiling and the admin listing would
+otherwise be open to anyone.
+
+Each profiled request leaves three files in the profile directory:
+
+* ``<name>.prof``   - cProfile stats, for pstats/snakeviz
+* ``<name>.folded`` - sampled collapsed stacks, for flamegraph.pl/speedscope
+* ``<name>.json``   - request metadata, used by the admin listing
+
+On Python 3.12+ cProfile hooks the whole process, so the ``.prof`` covers
+every thread while the request runs, including other requests served
+concurrently by the same worker, and only one request per process can be
+profiled at a time. The ``.folded`` samples are limited to the request: its
+own thread and, for async views (which Flask hands to an asgiref event loop
+on another thread), that loop thread, rooted at "request" or "event loop".
+
+Only the newest PROFILE_MAX_COUNT profiles are kept.
+"""
+
+import cProfile
+import functools
+import hmac
+import inspect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import abort, g, jsonify, request, send_from_directory
+
+PROFILE_EXTENSIONS = (".prof", ".folded", ".json")
+
+logger = logging.getLogger(__name__)
+
+
+class StackSampler:
+    """Samples threads' Python stacks at a fixed interval into collapsed stacks."""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        # Thread id -> label used as the root frame of its stacks
+        self.threads = {thread_id: "request"}
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start sampling in a background thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        self._thread.join()
+
+    def add_thread(self, thread_id: int, label: str):
+        """Also sample thread_id from now on, with stacks rooted at label."""
+        self.threads = {**self.threads, thread_id: label}
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            # pylint: disable-next=protected-access
+            frames = sys._current_frames()
+            for thread_id, label in self.threads.items():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    filename = os.path.basename(code.co_filename)
+                    stack.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if stack:
+                    stack.append(label)
+                    self.stacks[";".join(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        """Collapsed stack lines: 'outer;inner;leaf count'."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+class RequestProfiler:
+    """Wraps flagged requests in cProfile plus a stack sampler."""
+
+    def __init__(self, app=None):
+        self.app = app
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read the profiling config and register hooks and admin routes."""
+        self.app = app
+        app.config.setdefault(
+            "PROFILING_ENABLED", os.environ.get("STATEJOBS_PROFILING") == "1"
+        )
+        app.config.setdefault(
+            "PROFILING_TOKEN", os.environ.get("STATEJOBS_PROFILING_TOKEN")
+        )
+        app.config.setdefault(
+            "PROFILE_DIR", os.environ.get("STATEJOBS_PROFILE_DIR", "profiles")
+        )
+        app.config.setdefault(
+            "PROFILE_MAX_COUNT", int(os.environ.get("STATEJOBS_PROFILE_MAX_COUNT", 50))
+        )
+
+        if not app.config["PROFILING_ENABLED"]:
+            return
+        if not app.config["PROFILING_TOKEN"]:
+            logger.warning(
+                "STATEJOBS_PROFILING is set without STATEJOBS_PROFILING_TOKEN "
+                "- profiling stays disabled."
+            )
+            return
+
+        app.before_request(self._start)
+        app.teardown_request(self._stop)
+        app.ensure_sync = self._wrap_ensure_sync(app.ensure_sync)
+        app.add_url_rule("/admin/profiles", "admin_profiles", self.list_profiles)
+        app.add_url_rule(
+            "/admin/profiles/<path:filename>", "admin_profile_file", self.get_profile
+        )
+
+    @property
+    def profile_dir(self) -> str:
+        """Absolute path of the profile directory."""
+        return os.path.join(self.app.root_path, self.app.config["PROFILE_DIR"])
+
+    def _token_ok(self, value: str | None) -> bool:
+        return bool(value) and hmac.compare_digest(
+            value, self.app.config["PROFILING_TOKEN"]
+        )
+
+    def _requested(self) -> bool:
+        return self._token_ok(
+            request.headers.get("X-Profile") or request.args.get("profile")
+        )
+
+    def _start(self):
+        if not self._requested():
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active; on 3.12+ that is any other
+            # profiled request in this process
+            return
+        g.profiler = profiler
+        g.sampler = StackSampler(threading.get_ident())
+        g.profile_started = time.perf_counter()
+        g.sampler.start()
+
+    def _wrap_ensure_sync(self, ensure_sync):
+        """Make Flask's ensure_sync sample async views where they actually run."""
+
+        @functools.wraps(ensure_sync)
+        def wrapper(func):
+            if inspect.iscoroutinefunction(func):
+                func = self._sample_coroutine(func)
+            return ensure_sync(func)
+
+        return wrapper
+
+    @staticmethod
+    def _sample_coroutine(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            sampler = g.get("sampler")
+            if sampler is not None:
+                # Runs on asgiref's event loop thread, not the request thread
+                sampler.add_thread(threading.get_ident(), "event loop")
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    def _stop(self, _exc=None):
+        profiler = g.pop("profiler", None)
+        if profiler is None:
+            return
+        profiler.disable()
+        sampler = g.pop("sampler")
+        sampler.stop()
+        duration = time.perf_counter() - g.pop("profile_started")
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        millis = time.time_ns() // 1_000_000 % 1000
+        name = (
+            f"{time.strftime('%Y%m%d-%H%M%S')}.{millis:03d}"
+            f"-{os.getpid()}-{request.endpoint}"
+        )
+        base = os.path.join(self.profile_dir, name)
+
+        profiler.dump_stats(base + ".prof")
+        with open(base + ".folded", "w", encoding="utf-8") as f:
+            f.write(sampler.folded())
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "name": name,
+                    "method": request.method,
+                    "path": request.path,
+                    "endpoint": request.endpoint,
+                    "duration_ms": round(duration * 1000, 1),
+                    "samples": sum(sampler.stacks.values()),
+                    "created": time.time(),
+                },
+                f,
+            )
+
+        self._prune()
+
+    def _prune(self):
+        """Delete the oldest profiles beyond PROFILE_MAX_COUNT."""
+        metas = sorted(
+            (e for e in os.scandir(self.profile_dir) if e.name.endswith(".json")),
+            key=lambda e: e.stat().st_mtime,
+            reverse=True,
+        )
+        for entry in metas[self.app.config["PROFILE_MAX_COUNT"] :]:
+            base = entry.path[: -len(".json")]
+            for ext in PROFILE_EXTENSIONS:
+                try:
+                    os.remove(base + ext)
+                except FileNotFoundError:
+                    pass
+
+    def _check_admin(self):
+        if not self._token_ok(
+            request.headers.get("X-Profile-Token") or request.args.get("token")
+        ):
+            abort(403)
+
+    def list_profiles(self):
+        """Admin endpoint: metadata for the saved profiles, newest first."""
+        self._check_admin()
+        profiles = []
+        if os.path.isdir(self.profile_dir):
+            for entry in os.scandir(self.profile_dir):
+                if not entry.name.endswith(".json"):
+                    continue
+                with open(entry.path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                meta["files"] = [meta["name"] + ext for ext in (".prof", ".folded")]
+                profiles.append(meta)
+        profiles.sort(key=lambda p: p["created"], reverse=True)
+        return jsonify(profiles)
+
+    def get_profile(self, filename: str):
+        """Admin endpoint: download a saved .prof or .folded file."""
+        self._check_admin()
+        if not filename.endswith((".prof", ".folded")):
+            abort(404)
+        return send_from_directory(self.profile_dir, filename, as_attachment=True)
@@ -0,0 +1,138 @@
+"""
+Export and import of the vacancy cache as a compressed, versioned snapshot.
+
+A snapshot is a gzip stream of JSON lines: a header line identifying the
+format and version, then one line per cached vacancy holding the raw HTML and
+the parsed record (the HTML is empty for entries cached without it). Importing
+reads the file through mmap and decodes one line
+at a time, so a large snapshot never has to be fully decompressed in memory.
+"""
+
+import contextlib
+import gzip
+import json
+import mmap
+import os
+import time
+
+from statejobs_helper.cache import VacancyCache, vacancy_cache
+
+SNAPSHOT_FORMAT = "statejobs-helper-cache"
+SNAPSHOT_VERSION = 1
+
+# Oldest entry import_snapshot will load. This is deliberately longer than the
+# cache TTL so a snapshot baked into an image still has a fallback for every
+# job after a deploy days later; entries past the TTL are loaded as stale.
+SNAPSHOT_MAX_AGE = int(os.environ.get("STATEJOBS_SNAPSHOT_MAX_AGE", 7 * 24 * 60 * 60))
+
+# Required keys of an entry line and the types they must have
+ENTRY_FIELDS = {
+    "job_id": str,
+    "fetched_at": (int, float),
+    "record": dict,
+    "html": str,
+}
+
+
+def export_snapshot(path: str, cache: VacancyCache = vacancy_cache) -> int:
+    """Write every cache entry to path. Returns the number exported."""
+    entries = cache.entries()
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created": time.time(),
+        "count": len(entries),
+    }
+
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as f:
+        f.write(json.dumps(header, separators=(",", ":")) + "\n")
+        for entry in entries:
+            line = {
+                "job_id": entry.job_id,
+                "fetched_at": entry.fetched_at,
+                "record": entry.record,
+                "html": entry.html or "",
+            }
+            f.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+    return len(entries)
+
+
+@contextlib.contextmanager
+def open_snapshot(path: str):
+    """
+    Open a snapshot, yielding (header, entries) where entries lazily decodes
+    one entry dict per line.
+
+    Raises ValueError if the file isn't a snapshot of a supported version.
+    """
+    with open(path, "rb") as raw:
+        try:
+            mapped = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            # mmap refuses empty files
+            raise ValueError(f"Not a cache snapshot: {path}") from e
+
+        with mapped, gzip.GzipFile(fileobj=mapped) as f:
+            try:
+                header = json.loads(f.readline())
+            except (OSError, EOFError, ValueError) as e:
+                raise ValueError(f"Not a cache snapshot: {path}") from e
+
+            if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(f"Not a cache snapshot: {path}")
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Unsupported snapshot version {header.get('version')} "
+                    f"(expected {SNAPSHOT_VERSION})"
+                )
+
+            yield header, _decode_entries(f, path)
+
+
+def _decode_entries(f, path: str):
+    """Yield validated entry dicts, raising ValueError on a corrupt line."""
+    line_number = 1
+    try:
+        for line in f:
+            line_number += 1
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if not isinstance(item, dict) or not all(
+                isinstance(item.get(key), kind) for key, kind in ENTRY_FIELDS.items()
+            ):
+                raise ValueError("missing or invalid fields")
+            yield item
+    except (OSError, EOFError, ValueError) as e:
+        # Also covers truncated gzip streams and bad JSON
+        raise ValueError(f"Corrupt snapshot entry on line {line_number}: {path}") from e
+
+
+def import_snapshot(
+    path: str, cache: VacancyCache = vacancy_cache, max_age: float = SNAPSHOT_MAX_AGE
+) -> tuple[int, int]:
+    """
+    Load a snapshot into the cache, skipping entries older than max_age.
+
+    Entries keep their original fetch time, so those past the cache TTL are
+    loaded as stale: they are re-fetched on first use and only served if that
+    fetch fails.
+
+    Returns (entries loaded, entries in the snapshot). Raises ValueError if the
+    file or one of its entries is invalid.
+    """
+    loaded = 0
+    total = 0
+    now = time.time()
+
+    with open_snapshot(path) as (_, entries):
+        for item in entries:
+            total += 1
+            age = now - item["fetched_at"]
+            if age > max_age:
+                continue
+            cache.put(item["job_id"], item["html"], item["record"], item["fetched_at"])
+            loaded += 1
+
+    return loaded, total
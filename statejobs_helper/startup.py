@@ -0,0 +1,139 @@
+"""
+Startup cost helpers: preloading heavy dependencies and an import-time report.
+
+Heavy dependencies are imported lazily so ``import app`` and the CLI start
+quickly. Under gunicorn, ``preload()`` runs once in the master process (see
+gunicorn.conf.py) so forked workers share the loaded modules copy-on-write.
+
+Run ``python -m statejobs_helper.startup`` to check that importing the app or
+CLI does not pull any of them in eagerly; it exits non-zero on a regression.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+from statejobs_helper.coverletter import get_nlp
+from statejobs_helper.utilities import load_pdfkit
+
+# Modules that must only be imported on first use (or by preload())
+HEAVY_MODULES = (
+    "spacy",
+    "docx",
+    "PyPDF2",
+    "reportlab",
+    "pdfkit",
+    "numpy",
+    "httpx",
+)
+
+# Entry points whose import must stay free of HEAVY_MODULES
+ENTRY_POINTS = ("app", "statejobs_helper.cli")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import json, sys
+import {target}
+print(json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+def preload():
+    """Import every heavy dependency and load the SpaCy model now."""
+    for module in ("docx", "PyPDF2", "reportlab.pdfgen.canvas"):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+    load_pdfkit()
+    get_nlp()
+
+
+def measure_import(target: str) -> dict:
+    """
+    Import target in a fresh interpreter under ``-X importtime``.
+
+    Returns the total import time, the slowest top-level imports and any
+    HEAVY_MODULES that ended up loaded.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE.format(target=target, heavy=HEAVY_MODULES),
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    # with nested imports indented two spaces per level under their importer.
+    total_us = 0
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append((name.strip(), int(cumulative) / 1000))
+        elif depth == 0 and name.strip() == target:
+            total_us = int(cumulative)
+            break
+        elif depth == 0:
+            # Children listed so far belonged to another top-level import
+            children = []
+
+    return {
+        "target": target,
+        "total_ms": total_us / 1000,
+        "slowest": sorted(children, key=lambda item: item[1], reverse=True),
+        "heavy_loaded": json.loads(result.stdout.strip().splitlines()[-1]),
+    }
+
+
+def main():
+    """
+    Report import time for the app and CLI and fail if heavy modules load eagerly.
+    """
+    parser = argparse.ArgumentParser(
+        description="Report import time of the app and CLI entry points."
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of slowest imports to show"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Fail if an entry point takes longer than this to import",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for target in ENTRY_POINTS:
+        report = measure_import(target)
+        print(f"\n{target}: {report['total_ms']:.1f} ms")
+        for name, ms in report["slowest"][: args.top]:
+            print(f"  {ms:9.1f} ms  {name}")
+
+        if report["heavy_loaded"]:
+            print(f"  FAIL: imported eagerly: {', '.join(report['heavy_loaded'])}")
+            failed = True
+        if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+            print(f"  FAIL: over budget of {args.budget_ms:.0f} ms")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
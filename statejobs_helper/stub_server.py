@@ -0,0 +1,216 @@
+"""
+Local stand-in for statejobs.ny.gov's vacancyDetailsView page, for load tests.
+
+Serves recorded pages from a cache snapshot (see ``cli.py export-cache``)
+and/or a directory of ``<job_id>.html`` files, falling back to a generated
+page for any other ID. Latency and error rates are configurable so the app
+can be exercised against a slow or flaky upstream.
+
+Point the app at it with STATEJOBS_BASE_URL=http://127.0.0.1:8001.
+"""
+
+import argparse
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from statejobs_helper.parser import VACANCY_PATH
+from statejobs_helper.snapshot import open_snapshot
+
+AGENCIES = (
+    "Taxation and Finance, Department of",
+    "Information Technology Services, Office of",
+    "Health, Department of",
+    "Transportation, Department of",
+    "General Services, Office of",
+)
+TITLES = (
+    "Information Technology Specialist 2",
+    "Administrative Analyst Trainee 1",
+    "Budgeting Analyst 2",
+    "Program Aide",
+    "Tax Technician 1",
+)
+
+SAMPLE_PAGE = """<!DOCTYPE html>
+<html><body>
+<div id="information">
+  <p class="row"><span class="leftCol">Title</span><span class="rightCol">{title}</span></p>
+  <p class="row"><span class="leftCol">Agency</span><span class="rightCol">{agency}</span></p>
+  <p class="row"><span class="leftCol">Salary Grade</span><span class="rightCol">{grade}</span></p>
+  <p class="row"><span class="leftCol">Salary Range</span>
+    <span class="rightCol">From ${low} to ${high} Annually</span></p>
+</div>
+<div class="columnReport">
+  <p class="row"><span class="leftCol">Date Posted</span>
+    <span class="rightCol">{posted}</span></p>
+  <p class="row"><span class="leftCol">Applications Due</span>
+    <span class="rightCol">{due}</span></p>
+</div>
+<div id="contact">
+  <p class="row"><span class="leftCol">Name</span><span class="rightCol">{name}</span></p>
+  <p class="row"><span class="leftCol">Email Address</span>
+    <span class="rightCol">jobs{job_id}@example.ny.gov</span></p>
+  <p class="row"><span class="leftCol">Street</span>
+    <span class="rightCol">{street} State Street</span></p>
+  <p class="row"><span class="leftCol"></span><span class="rightCol">Room {room}</span></p>
+  <p class="row"><span class="leftCol">City</span><span class="rightCol">Albany</span></p>
+  <p class="row"><span class="leftCol">State</span><span class="rightCol">NY</span></p>
+  <p class="row"><span class="leftCol">Zip Code</span><span class="rightCol">12207</span></p>
+</div>
+</body></html>
+"""
+
+
+def sample_page(job_id: str) -> str:
+    """A realistic vacancy page, generated deterministically from the job ID."""
+    rng = random.Random(job_id)
+    grade = rng.randint(6, 27)
+    low = 30000 + grade * 2500
+    return SAMPLE_PAGE.format(
+        job_id=job_id,
+        title=rng.choice(TITLES),
+        agency=rng.choice(AGENCIES),
+        grade=grade,
+        low=f"{low:,}",
+        high=f"{low + rng.randint(15, 40) * 1000:,}",
+        posted=f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2025",
+        due=f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2026",
+        name=rng.choice(("Jane Smith", "Human Resources Office", "Pat Jones")),
+        street=rng.randint(1, 999),
+        room=rng.randint(100, 999),
+    )
+
+
+def load_pages(snapshot: str | None = None, pages_dir: str | None = None) -> dict:
+    """Recorded pages keyed by job ID, from a snapshot and/or a directory."""
+    pages = {}
+    if snapshot:
+        with open_snapshot(snapshot) as (_, entries):
+            for item in entries:
+                pages[item["job_id"]] = item["html"]
+    if pages_dir:
+        for name in os.listdir(pages_dir):
+            if name.endswith(".html"):
+                with open(os.path.join(pages_dir, name), encoding="utf-8") as f:
+                    pages[name[: -len(".html")]] = f.read()
+    return pages
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves vacancy pages with the server's configured latency and error rate."""
+
+    server: "StubServer"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET /public/vacancyDetailsView.cfm?id=<job_id>."""
+        url = urlparse(self.path)
+        if url.path != VACANCY_PATH:
+            self.send_error(404)
+            return
+
+        job_id = parse_qs(url.query).get("id", [""])[0]
+        time.sleep(self.server.latency())
+
+        if self.server.should_fail():
+            self.send_error(503, "Injected failure")
+            return
+
+        body = self.server.page(job_id).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the console quiet under load."""
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the recorded pages and fault settings."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address,
+        pages: dict,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+    ):
+        super().__init__(address, StubHandler)
+        self.pages = pages
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+
+    def latency(self) -> float:
+        """Seconds to wait before answering a request."""
+        with self._lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        """Whether this request gets an injected 503."""
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def page(self, job_id: str) -> str:
+        """The recorded page for job_id, or a generated one."""
+        return self.pages.get(job_id) or sample_page(job_id)
+
+
+def main():
+    """
+    Run the stub server until interrupted.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve recorded statejobs vacancy pages for load testing."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--snapshot", help="Cache snapshot to serve pages from")
+    parser.add_argument("--pages", help="Directory of <job_id>.html pages")
+    parser.add_argument(
+        "--latency-ms", type=float, default=200, help="Mean response latency"
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=100, help="Uniform +/- latency jitter"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests answered with a 503 (0-1)",
+    )
+    args = parser.parse_args()
+
+    pages = load_pages(args.snapshot, args.pages)
+    server = StubServer(
+        (args.host, args.port),
+        pages,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+    )
+    print(
+        f"Serving {len(pages)} recorded pages (others generated) "
+        f"on http://{args.host}:{args.port}{VACANCY_PATH}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,23 +2,26 @@
 General utilities for the statejobs-helper project.
 """
 
+import functools
 import io
 import os
 import re
 
-from docx import Document
-from PyPDF2 import PdfReader
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+# python-docx, PyPDF2, reportlab and pdfkit are imported inside the functions
+# that need them so importing this module (and app.py) stays fast.
 
-# pdfkit optional
-try:
-    import pdfkit
 
-    PDFKIT_AVAILABLE = True
-except (ImportError, OSError):
-    # pdfkit is not installed (need to add to requirements.txt)
-    PDFKIT_AVAILABLE = False
+@functools.cache
+def load_pdfkit():
+    """Import pdfkit on first use; None when it isn't installed."""
+    try:
+        import pdfkit  # pylint: disable=import-outside-toplevel
+
+        return pdfkit
+    except (ImportError, OSError):
+        # pdfkit is not installed (need to add to requirements.txt)
+        return None
+
 
 # Liberation Sans is installed via Dockerfile and is a suitable replacement for Arial/Helvetica
 DEFAULT_FONT_FACE = "Liberation Sans"
@@ -112,6 +115,8 @@ def extract_text_and_html(file_storage):
         text_content = normalize_text(file_bytes.decode("utf-8", errors="ignore"))
 
     elif filename.endswith(".docx"):
+        from docx import Document  # pylint: disable=import-outside-toplevel
+
         doc = Document(io.BytesIO(file_bytes))
         paragraphs = [normalize_text(p.text) for p in doc.paragraphs]
         text_content = "\n\n".join(paragraphs)
@@ -141,6 +146,8 @@ def extract_text_and_html(file_storage):
                     pass
 
     elif filename.endswith(".pdf"):
+        from PyPDF2 import PdfReader  # pylint: disable=import-outside-toplevel
+
         pdf = PdfReader(io.BytesIO(file_bytes))
         text_pages = [normalize_text(page.extract_text() or "") for page in pdf.pages]
         text_content = "\n\n".join(text_pages)
@@ -158,6 +165,10 @@ def text_to_pdf(text, font_size="12pt"):
     Generates a PDF using ReportLab paragraph handling.
     Now accepts font_size to respect styling from the caller.
     """
+    # pylint: disable=import-outside-toplevel
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
 
@@ -213,7 +224,8 @@ def html_to_pdf(html_content, font_size="12pt"):
     """
     Generates a PDF from HTML using pdfkit (wkhtmltopdf), or falls back to text_to_pdf.
     """
-    if PDFKIT_AVAILABLE:
+    pdfkit = load_pdfkit()
+    if pdfkit:
         try:
             DEFAULT_CSS = f"""
                      body, body * {{
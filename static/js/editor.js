@@ -106,11 +106,8 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   });
 
-  // Download PDF
-  downloadBtn.addEventListener("click", () => {
-    const htmlContent = quill.root.innerHTML;
-
-    // POST HTML to download route
+  // Download PDF by posting the editor HTML to the download route
+  function submitDownloadForm(htmlContent) {
     const tempForm = document.createElement("form");
     tempForm.method = "POST";
     tempForm.action = "/coverletter/download";
@@ -138,9 +135,69 @@ document.addEventListener("DOMContentLoaded", () => {
       tempForm.appendChild(jobIdInput);
     }
 
-    clearDraft();
     document.body.appendChild(tempForm);
     tempForm.submit();
     document.body.removeChild(tempForm);
+  }
+
+  async function pollStatus(statusUrl, waitSeconds) {
+    const poll = await fetch(`${statusUrl}?wait=${waitSeconds}`);
+    if (!poll.ok) {
+      throw new Error(`Status check failed (${poll.status})`);
+    }
+    return poll.json();
+  }
+
+  // Queued mode: the server renders in the background, we wait on the status
+  // endpoint and then navigate to the finished file to download it.
+  async function queuedDownload(htmlContent) {
+    const data = new FormData();
+    data.append("letter_html", htmlContent);
+    data.append("font_size", hiddenFontSize.value);
+    data.append("mode", "queued");
+    if (hiddenJobId && hiddenJobId.value) {
+      data.append("job_id", hiddenJobId.value);
+    }
+
+    const response = await fetch("/coverletter/download", { method: "POST", body: data });
+    if (response.status !== 202) {
+      // Queue full or disabled, render in the request instead
+      submitDownloadForm(htmlContent);
+      return;
+    }
+
+    const job = await response.json();
+    let state = await pollStatus(job.status_url, 1);
+    while (state.status === "queued" || state.status === "running") {
+      // Short server-side waits with a pause between them, so a slow render
+      // never ties up a server thread for long
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      state = await pollStatus(job.status_url, 1);
+    }
+
+    if (state.status !== "done") {
+      throw new Error(state.error || "PDF render failed");
+    }
+    window.location.href = state.download_url;
+  }
+
+  downloadBtn.addEventListener("click", async () => {
+    const htmlContent = quill.root.innerHTML;
+    clearDraft();
+
+    if (form.dataset.pdfQueue !== "true") {
+      submitDownloadForm(htmlContent);
+      return;
+    }
+
+    downloadBtn.disabled = true;
+    try {
+      await queuedDownload(htmlContent);
+    } catch (err) {
+      console.error("Queued PDF download failed: ", err);
+      alert(`Could not generate the PDF: ${err.message}`);
+    } finally {
+      downloadBtn.disabled = false;
+    }
   });
 });